@@ -143,11 +143,7 @@ export default function App() {
     if (now - lastAutosaveMsRef.current < 2000) return;
 
     lastAutosaveMsRef.current = now;
-    try {
-      gameRef.current.saveGameState();
-    } catch {
-      // Intentionally ignore autosave errors to avoid gameplay interruption.
-    }
+    gameRef.current.scheduleAutosave();
   }, [gameState, gameOver, isRunning]);
 
   useEffect(() => {
@@ -222,6 +222,7 @@ export class GameEngine {
   private skillSystem: SkillSystem;
   private combatUtils: CombatUtils = new CombatUtils();
   private aiController: AIController; // NEW: Modular AI system
+  private cancelPendingAutosave: (() => void) | null = null;
   
   // Track one-time bonuses for Cyber Assassin
   private enemyCyberAssassin6kBonusUsed = false;
@@ -299,11 +300,18 @@ export class GameEngine {
         cooldownRemaining: 0,
       });
     }
-    base.turretSlots = base.turretSlots.slice(0, MAX_TURRET_SLOTS).map((slot, idx) => ({
-      slotIndex: idx,
-      turretId: slot?.turretId ?? null,
-      cooldownRemaining: Math.max(0, slot?.cooldownRemaining ?? 0),
-    }));
+    // Normalize slots in place rather than rebuilding the array and every slot object
+    base.turretSlots.length = MAX_TURRET_SLOTS;
+    for (let idx = 0; idx < MAX_TURRET_SLOTS; idx++) {
+      const slot = base.turretSlots[idx];
+      if (!slot) {
+        base.turretSlots[idx] = { slotIndex: idx, turretId: null, cooldownRemaining: 0 };
+        continue;
+      }
+      slot.slotIndex = idx;
+      slot.turretId = slot.turretId ?? null;
+      slot.cooldownRemaining = Math.max(0, slot.cooldownRemaining ?? 0);
+    }
     base.turretSlotsUnlocked = Math.min(MAX_TURRET_SLOTS, Math.max(1, base.turretSlotsUnlocked));
     return this.recomputeBaseTurretLevel(base);
   }
@@ -327,9 +335,7 @@ export class GameEngine {
     this.state.playerBase = this.ensureBaseTurretState(this.state.playerBase);
     this.state.enemyBase = this.ensureBaseTurretState(this.state.enemyBase);
     
-    // Keep bases anchored to the battlefield edges (width can change with age upgrades)
-    this.state.playerBase.x = 0;
-    this.state.enemyBase.x = this.state.battlefield.width;
+    this.anchorBasePositions();
     
     console.log('Base positions synced:', {
       player: this.state.playerBase.x,
@@ -338,6 +344,12 @@ export class GameEngine {
     });
   }
 
+  // Cheap per-tick variant: keep bases anchored to the battlefield edges (width can change with age upgrades)
+  private anchorBasePositions(): void {
+    this.state.playerBase.x = 0;
+    this.state.enemyBase.x = this.state.battlefield.width;
+  }
+
   private createInitialState(): GameState {
     const playerBase = this.createBaseState(BASE_CONFIG.baseHealth, 0);
     const enemyBaseHealth = this.config.difficulty === 'EASY' ? 300 :
@@ -491,6 +503,10 @@ export class GameEngine {
     if (!this.isRunning) return;
     this.isRunning = false;
     this.isPaused = false;
+    if (this.cancelPendingAutosave) {
+      this.cancelPendingAutosave();
+      this.cancelPendingAutosave = null;
+    }
     if (this.coreLoop) {
       this.coreLoop.stop();
       this.coreLoop = null;
@@ -542,7 +558,8 @@ export class GameEngine {
     }
 
     // Battlefield width can change with age upgrades; keep base positions in sync.
-    this.syncBasePositions();
+    // Full slot normalization only happens on init/load/age-up (syncBasePositions).
+    this.anchorBasePositions();
 
     // Convert deltaTime to seconds for economy
     const deltaSeconds = Math.min(deltaTime / 1000, 0.1); // Cap at 100ms
@@ -696,8 +713,28 @@ export class GameEngine {
 
   // Extract complete game state for AI decision-making
   private extractGameStateForAI(): GameStateSnapshot {
-    const playerUnits = Array.from(this.state.entities.values()).filter(e => e.owner === 'PLAYER');
-    const enemyUnits = Array.from(this.state.entities.values()).filter(e => e.owner === 'ENEMY');
+    // Single pass over entities: build both unit summaries and the near-base counters directly
+    const playerUnits: GameStateSnapshot['playerUnits'] = [];
+    const enemyUnits: GameStateSnapshot['enemyUnits'] = [];
+    let playerUnitsNearEnemyBase = 0;
+    let enemyUnitsNearPlayerBase = 0;
+    for (const e of this.state.entities.values()) {
+      const summary = {
+        unitId: e.unitId,
+        health: e.health.current,
+        maxHealth: e.health.max,
+        position: e.transform.x,
+        damage: e.attack.damage,
+        range: e.attack.range
+      };
+      if (e.owner === 'PLAYER') {
+        playerUnits.push(summary);
+        if (Math.abs(e.transform.x - this.state.enemyBase.x) < 15) playerUnitsNearEnemyBase++;
+      } else {
+        enemyUnits.push(summary);
+        if (Math.abs(e.transform.x - this.state.playerBase.x) < 15) enemyUnitsNearPlayerBase++;
+      }
+    }
     const playerTurretStats = calculateTurretDefenseStats(this.state.playerBase);
     const enemyTurretStats = calculateTurretDefenseStats(this.state.enemyBase);
     const playerTurretSummary = this.state.playerBase.turretSlots.map((slot) => ({
@@ -758,22 +795,8 @@ export class GameEngine {
       // Units
       playerUnitCount: playerUnits.length,
       enemyUnitCount: enemyUnits.length,
-      playerUnits: playerUnits.map(e => ({
-        unitId: e.unitId,
-        health: e.health.current,
-        maxHealth: e.health.max,
-        position: e.transform.x,
-        damage: e.attack.damage,
-        range: e.attack.range
-      })),
-      enemyUnits: enemyUnits.map(e => ({
-        unitId: e.unitId,
-        health: e.health.current,
-        maxHealth: e.health.max,
-        position: e.transform.x,
-        damage: e.attack.damage,
-        range: e.attack.range
-      })),
+      playerUnits,
+      enemyUnits,
       
       // Queues
       playerQueueSize: this.state.playerQueue.length,
@@ -790,12 +813,8 @@ export class GameEngine {
       difficulty: this.config.difficulty,
       
       // Additional analysis
-      playerUnitsNearEnemyBase: playerUnits.filter(e => 
-        Math.abs(e.transform.x - this.state.enemyBase.x) < 15
-      ).length,
-      enemyUnitsNearPlayerBase: enemyUnits.filter(e => 
-        Math.abs(e.transform.x - this.state.playerBase.x) < 15
-      ).length,
+      playerUnitsNearEnemyBase,
+      enemyUnitsNearPlayerBase,
       lastEnemyBaseAttackTime: this.state.enemyBase.lastAttackTime
     };
   }
@@ -1403,6 +1422,32 @@ export class GameEngine {
     }
   }
 
+  /**
+   * Schedule an autosave for when the browser is idle, so serialization and the
+   * localStorage write stay off the tick/render path. Repeated calls coalesce.
+   */
+  scheduleAutosave(): void {
+    if (this.cancelPendingAutosave) return;
+
+    const run = () => {
+      this.cancelPendingAutosave = null;
+      if (!this.isRunning) return;
+      try {
+        this.saveGameState();
+      } catch {
+        // Intentionally ignore autosave errors to avoid gameplay interruption.
+      }
+    };
+
+    if (typeof window.requestIdleCallback === 'function') {
+      const handle = window.requestIdleCallback(run, { timeout: 1000 });
+      this.cancelPendingAutosave = () => window.cancelIdleCallback(handle);
+    } else {
+      const handle = window.setTimeout(run, 0);
+      this.cancelPendingAutosave = () => clearTimeout(handle);
+    }
+  }
+
   /**
    * Load complete game state from localStorage
    * Converts array back to Map and validates data integrity
@@ -663,13 +663,20 @@ export function getTurretEngineDef(turretId: string): TurretEngineDef | null {
   return TURRET_ENGINES[turretId] ?? null;
 }
 
+const turretEnginesByAgeCache = new Map<number, Record<string, TurretEngineDef>>();
+
+// TURRET_ENGINES is static, so each per-age table is built once and shared (treat as read-only).
 export function getTurretEnginesForAge(age: number): Record<string, TurretEngineDef> {
+  const cached = turretEnginesByAgeCache.get(age);
+  if (cached) return cached;
+
   const result: Record<string, TurretEngineDef> = {};
   for (const [id, def] of Object.entries(TURRET_ENGINES)) {
     if (def.age <= age) {
       result[id] = def;
     }
   }
+  turretEnginesByAgeCache.set(age, result);
   return result;
 }
 
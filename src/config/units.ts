@@ -499,16 +499,23 @@ export const UNIT_DEFS: Record<string, UnitDef> = {
   },
 };
 
+const unitsByAgeCache = new Map<number, Record<string, UnitDef>>();
+
 /**
  * Get all units available for a specific age
+ * UNIT_DEFS is static, so the per-age table is built once and shared (treat as read-only).
  */
 export function getUnitsForAge(age: number): Record<string, UnitDef> {
+  const cached = unitsByAgeCache.get(age);
+  if (cached) return cached;
+
   const result: Record<string, UnitDef> = {};
   for (const [key, def] of Object.entries(UNIT_DEFS)) {
     if (def.age === age) {
       result[key] = def;
     }
   }
+  unitsByAgeCache.set(age, result);
   return result;
 }
 
@@ -7,9 +7,12 @@ import { CombatUtils } from './CombatUtils';
 const FIXED_TIMESTEP = 1000 / 60;
 
 export class EntitySystem {
+  // Reused across ticks; insertion-ordered and de-duplicated removal list
+  private readonly toRemove = new Set<number>();
   
   public update(state: GameState, deltaSeconds: number, projectileSystem: any): void {
-    const toRemove: number[] = [];
+    const toRemove = this.toRemove;
+    toRemove.clear();
     const damageStats = state.stats.damageDealt;
 
     // Use a secondary list to avoid iterator invalidation issues if concurrent mods happen (JS is single threaded but logic might vary)
@@ -40,18 +43,27 @@ export class EntitySystem {
 
       const minSpacing = baseLegacyWidth * scale * widthMult;
 
+      // Per-entity constants for the pairwise scan below
+      // GHOST LOGIC: If either unit has width roughly 0, they do not collide
+      const isGhost = (unitDef?.width ?? 1) < 0.1;
+      const attackRange = entity.attack.range ?? 1;
+      const targetRange = attackRange + 0.5;
+      const enemyBlockDist = attackRange > 1.5 ? 0.3 : 1.0;
+      const selfX = entity.transform.x;
+      const movingRight = entity.kinematics.vx > 0;
+
       for (const [otherId, other] of state.entities) {
+        if (isGhost) break; // Ghosts neither collide nor pick targets
         if (id === otherId) continue;
         
-        // GHOST LOGIC: If either unit has width roughly 0, they do not collide
         const otherDef = UNIT_DEFS[other.unitId];
-        if ((unitDef?.width ?? 1) < 0.1 || (otherDef?.width ?? 1) < 0.1) continue;
+        if ((otherDef?.width ?? 1) < 0.1) continue;
 
-        const dx = other.transform.x - entity.transform.x;
+        const dx = other.transform.x - selfX;
         const distance = Math.abs(dx);
         // Facing check: only blocked by things in front
         // STRICT directionality check. If units are perfectly overlapped, they do NOT block each other.
-        const isInFront = (entity.kinematics.vx > 0 ? dx > 0 : dx < 0);
+        const isInFront = (movingRight ? dx > 0 : dx < 0);
 
         // Collision with allies
         if (entity.owner === other.owner) {
@@ -63,17 +75,12 @@ export class EntitySystem {
           }
         } else {
           // Opponent: select as target if within attack range
-          if (!target && distance <= (entity.attack.range ?? 1) + 2.5) { 
-             // Logic used +0.5 before, allowing slight tolerance. 
-             // Original: distance <= (entity.attack.range ?? 1) + 0.5
-             // "2.5" seems permissive? Let's stick to original logic: +0.5
-             if (distance <= (entity.attack.range ?? 1) + 0.5) {
-                 target = other;
-             }
+          // Logic used +0.5 before, allowing slight tolerance (an earlier +2.5 pre-check was redundant).
+          if (!target && distance <= targetRange) {
+              target = other;
           }
 
           // Block movement for physical collisions
-          const enemyBlockDist = (entity.attack.range ?? 1) > 1.5 ? 0.3 : 1.0;
           if (isInFront && distance < enemyBlockDist) {
             blocked = true;
           }
@@ -127,7 +134,7 @@ export class EntitySystem {
 
       // Step 6: Out of bounds check
       if (entity.transform.x < -5 || entity.transform.x > state.battlefield.width + 5) {
-        toRemove.push(id);
+        toRemove.add(id);
       }
     }
 
@@ -137,7 +144,7 @@ export class EntitySystem {
     // Let's add a pass for dead entities.
     for (const [id, entity] of state.entities) {
         if (entity.health.current <= 0) {
-            if (!toRemove.includes(id)) toRemove.push(id);
+            toRemove.add(id);
         }
     }
 
@@ -3,8 +3,13 @@ import { UNIT_DEFS } from '../config/units';
 import { CombatUtils } from './CombatUtils';
 
 export class ProjectileSystem {
+  // Reused across ticks so removal bookkeeping and hit scans do not allocate per update
+  private readonly projToRemove = new Set<number>();
+  private readonly candidates: Entity[] = [];
+
   public update(state: GameState, deltaSeconds: number): void {
-    const projToRemove: number[] = [];
+    const projToRemove = this.projToRemove;
+    projToRemove.clear();
 
     for (const p of state.projectiles) {
       if (p.delayMs && p.delayMs > 0) {
@@ -33,7 +38,7 @@ export class ProjectileSystem {
         }
         const baseHit = CombatUtils.applyDamageToBase(state, 'ENEMY', p.damage);
         state.stats.damageDealt.player += baseHit.actualDamage;
-        projToRemove.push(p.id);
+        projToRemove.add(p.id);
         hitResolved = true;
       } else if (p.owner === 'ENEMY' && p.x <= 1) {
         if (p.splitOnImpact) {
@@ -41,7 +46,7 @@ export class ProjectileSystem {
         }
         const baseHit = CombatUtils.applyDamageToBase(state, 'PLAYER', p.damage);
         state.stats.damageDealt.enemy += baseHit.actualDamage;
-        projToRemove.push(p.id);
+        projToRemove.add(p.id);
         hitResolved = true;
       }
 
@@ -50,7 +55,8 @@ export class ProjectileSystem {
       }
 
       const targetOwner = p.owner === 'PLAYER' ? 'ENEMY' : 'PLAYER';
-      const candidates: Entity[] = [];
+      const candidates = this.candidates;
+      candidates.length = 0;
 
       for (const ent of state.entities.values()) {
         if (ent.owner !== targetOwner) continue;
@@ -94,7 +100,7 @@ export class ProjectileSystem {
         }
 
         if (p.isFalling) {
-          projToRemove.push(p.id);
+          projToRemove.add(p.id);
           continue;
         }
 
@@ -103,18 +109,23 @@ export class ProjectileSystem {
           const direction = p.owner === 'PLAYER' ? 1 : -1;
           p.x += direction * 1.1;
         } else {
-          projToRemove.push(p.id);
+          projToRemove.add(p.id);
         }
       }
 
       if (p.lifeMs <= 0) {
-        projToRemove.push(p.id);
+        projToRemove.add(p.id);
       }
     }
 
-    if (projToRemove.length > 0) {
-      const removeSet = new Set(projToRemove);
-      state.projectiles = state.projectiles.filter((proj) => !removeSet.has(proj.id));
+    if (projToRemove.size > 0) {
+      const projectiles = state.projectiles;
+      let write = 0;
+      for (let read = 0; read < projectiles.length; read++) {
+        const proj = projectiles[read];
+        if (!projToRemove.has(proj.id)) projectiles[write++] = proj;
+      }
+      projectiles.length = write;
     }
   }
 
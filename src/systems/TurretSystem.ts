@@ -24,8 +24,23 @@ interface OilGroundPatch {
   tickDamage: number;
 }
 
+// Ability DPS only depends on the static unit definition, so derive it once per unit type
+const skillDpsByUnitId = new Map<string, number>();
+
+function getUnitSkillDps(unitId: string): number {
+  const cached = skillDpsByUnitId.get(unitId);
+  if (cached !== undefined) return cached;
+
+  const skill = UNIT_DEFS[unitId]?.skill;
+  const skillDps = skill
+    ? ((skill.damage ?? skill.power ?? 0) * Math.max(skill.radius ?? skill.power ?? 1, 1)) / Math.max(skill.cooldownMs / 1000, 0.1)
+    : 0;
+  skillDpsByUnitId.set(unitId, skillDps);
+  return skillDps;
+}
+
 export class TurretSystem {
-  private oilPatches: OilGroundPatch[] = [];
+  private readonly oilPatches: OilGroundPatch[] = [];
   private siphonTargetsBySlot: Map<string, number> = new Map();
 
   private getForwardDirection(owner: 'PLAYER' | 'ENEMY'): 1 | -1 {
@@ -178,8 +193,11 @@ export class TurretSystem {
   private updateOilPatches(state: GameState, deltaSeconds: number): void {
     if (this.oilPatches.length === 0) return;
 
-    const nextPatches: OilGroundPatch[] = [];
-    for (const patch of this.oilPatches) {
+    // Compact the long-lived patch list in place instead of rebuilding it every tick
+    const patches = this.oilPatches;
+    let write = 0;
+    for (let read = 0; read < patches.length; read++) {
+      const patch = patches[read];
       patch.remainingSeconds -= deltaSeconds;
       patch.tickCountdownSeconds -= deltaSeconds;
 
@@ -213,11 +231,11 @@ export class TurretSystem {
       }
 
       if (patch.remainingSeconds > 0) {
-        nextPatches.push(patch);
+        patches[write++] = patch;
       }
     }
 
-    this.oilPatches = nextPatches;
+    patches.length = write;
   }
 
   private selectTarget(
@@ -236,18 +254,13 @@ export class TurretSystem {
 
       const healthPct = entity.health.max > 0 ? entity.health.current / entity.health.max : 0;
       const dps = entity.attack.damage * Math.max(entity.attack.speed, 0.2);
-      const unitDef = UNIT_DEFS[entity.unitId];
-      const skill = unitDef?.skill;
-      const skillDps = skill
-        ? ((skill.damage ?? skill.power ?? 0) * Math.max(skill.radius ?? skill.power ?? 1, 1)) / Math.max(skill.cooldownMs / 1000, 0.1)
-        : 0;
 
       let score = 0;
       if (engine.targeting === 'nearest') score = -dist;
       else if (engine.targeting === 'healthiest') score = entity.health.current + healthPct * 1000;
       else if (engine.targeting === 'lowest_health') score = -entity.health.current;
       else if (engine.targeting === 'highest_dps') score = dps * 10 - dist;
-      else if (engine.targeting === 'strongest_ability_dps') score = skillDps * 10 + dps * 3 - dist;
+      else if (engine.targeting === 'strongest_ability_dps') score = getUnitSkillDps(entity.unitId) * 10 + dps * 3 - dist;
 
       if (score > bestScore) {
         bestScore = score;
@@ -452,8 +465,9 @@ export class TurretSystem {
     const forwardReachUnits = Math.max(0.4, config.forwardReachUnits ?? config.radius);
     const backReachUnits = Math.max(0.2, config.backReachUnits ?? Math.max(0.6, config.radius * 0.6));
     const laneHalfHeight = Math.max(1.3, config.radius * 0.75);
-    const hasTargetsInPourZone = Array.from(state.entities.values()).some(
-      (entity) => this.isEntityInsideOilZone(
+    let hasTargetsInPourZone = false;
+    for (const entity of state.entities.values()) {
+      if (this.isEntityInsideOilZone(
         entity,
         targetOwner,
         baseX,
@@ -463,8 +477,11 @@ export class TurretSystem {
         laneHalfHeight,
         forwardReachUnits,
         backReachUnits
-      )
-    );
+      )) {
+        hasTargetsInPourZone = true;
+        break;
+      }
+    }
     if (!hasTargetsInPourZone) return false;
 
     const initialImpactDamage = Math.max(0, config.initialDamage ?? (config.damage * 0.55));
@@ -571,14 +588,18 @@ export class TurretSystem {
     // One drone per cycle; cadence is controlled by cooldownSeconds (requested 4.8s).
     const targetOwner = owner === 'PLAYER' ? 'ENEMY' : 'PLAYER';
     const direction = owner === 'PLAYER' ? 1 : -1;
-    const inRangeTargets = Array.from(state.entities.values()).filter(
-      (entity) => entity.owner === targetOwner && entity.health.current > 0 && Math.abs(entity.transform.x - mount.x) <= engine.range
-    );
-    const farthestX = inRangeTargets.length > 0
-      ? direction === 1
-        ? Math.max(...inRangeTargets.map((entity) => entity.transform.x))
-        : Math.min(...inRangeTargets.map((entity) => entity.transform.x))
-      : target.transform.x;
+    // Single pass for the farthest in-range enemy along the firing direction
+    let farthestX = target.transform.x;
+    let hasInRangeTarget = false;
+    for (const entity of state.entities.values()) {
+      if (entity.owner !== targetOwner || entity.health.current <= 0) continue;
+      if (Math.abs(entity.transform.x - mount.x) > engine.range) continue;
+      const x = entity.transform.x;
+      if (!hasInRangeTarget || (direction === 1 ? x > farthestX : x < farthestX)) {
+        farthestX = x;
+        hasInRangeTarget = true;
+      }
+    }
     const overflyPadding = Math.max(1.2, config.overflyPadding ?? 2.4);
     const overflyX = farthestX + direction * overflyPadding;
     const cruiseY = Math.max(6, config.cruiseHeight ?? 8.5);
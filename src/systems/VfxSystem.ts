@@ -16,13 +16,17 @@ export interface VfxData {
 export class VfxSystem {
   public update(state: GameState, deltaSeconds: number): void {
     const deltaMs = deltaSeconds * 1000;
+    const vfxList = state.vfx;
     
-    // Filter in place or reassign? GameEngine did reassign.
-    state.vfx = state.vfx.filter(vfx => {
+    // Compact in place so the per-tick decay pass does not allocate a new array
+    let write = 0;
+    for (let read = 0; read < vfxList.length; read++) {
+      const vfx = vfxList[read];
       vfx.lifeMs -= deltaMs;
       // You could add more logic here, e.g. updating position for moving particles
-      return vfx.lifeMs > 0;
-    });
+      if (vfx.lifeMs > 0) vfxList[write++] = vfx;
+    }
+    vfxList.length = write;
   }
 
   // Create a new VFX cleanly